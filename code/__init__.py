@@ -1,9 +1,14 @@
 """NVIDIA Voice Agent - Voice-enabled conversational AI using Riva and Nvidia models."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .config import Config
-from .speech_service import SpeechService, get_speech_service
-from .agent import ConversationAgent, AgentFactory
-from .conversation import VoiceConversation
+
+if TYPE_CHECKING:
+    from .speech_service import SpeechService, get_speech_service
+    from .agent import ConversationAgent, AgentFactory
+    from .conversation import VoiceConversation
 
 __version__ = "0.1.0"
 __author__ = "NVIDIA"
@@ -16,3 +21,21 @@ __all__ = [
     "AgentFactory",
     "VoiceConversation",
 ]
+
+# Components that pull in grpc, riva, numpy, soundfile or openai are only
+# imported when first accessed, so Config-only use stays fast
+_LAZY_ATTRS = {
+    "SpeechService": ".speech_service",
+    "get_speech_service": ".speech_service",
+    "ConversationAgent": ".agent",
+    "AgentFactory": ".agent",
+    "VoiceConversation": ".conversation",
+}
+
+
+def __getattr__(name: str):
+    """Import components from their submodules on first access."""
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
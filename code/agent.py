@@ -1,8 +1,93 @@
 """Conversational AI agent using NVIDIA models."""
 
-from typing import Optional, List, Dict
-from openai import OpenAI
+from __future__ import annotations
+
+import asyncio
+import atexit
+import hashlib
+import itertools
+import re
+import time
+from typing import TYPE_CHECKING, Optional, List, Dict, Iterator, Tuple
+import httpx
+import orjson
+from cachetools import TTLCache
 from .config import Config, logger
+from .semantic_cache import SemanticCache
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+# Exact-match response cache shared by all agents, keyed by _cache_key()
+_RESPONSE_CACHE: TTLCache = TTLCache(
+    maxsize=Config.RESPONSE_CACHE_SIZE, ttl=Config.RESPONSE_CACHE_TTL
+)
+
+# Sentence boundary used to split streamed responses
+_SENTENCE_END = re.compile(r"[.!?]\s")
+
+# Semantic cache for single-turn questions (loads its model on first use)
+_SEMANTIC_CACHE: Optional[SemanticCache] = (
+    SemanticCache() if Config.ENABLE_SEMANTIC_CACHE else None
+)
+
+
+# HTTP/2 connection pools shared by all agents' API clients
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=Config.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE,
+)
+_HTTP_CLIENT: Optional[httpx.Client] = None
+_ASYNC_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_ASYNC_HTTP_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(
+            http2=True, timeout=Config.HTTP_TIMEOUT, limits=_HTTP_LIMITS
+        )
+        atexit.register(_HTTP_CLIENT.close)
+    return _HTTP_CLIENT
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for the running event loop.
+
+    Async connections are bound to the loop that opened them, so the client
+    is replaced when called from a different loop than the last one. The
+    old client is closed on its own loop if that loop is still running;
+    callers should await ConversationAgent.aclose() before their loop ends.
+    """
+    global _ASYNC_HTTP_CLIENT, _ASYNC_HTTP_LOOP
+    loop = asyncio.get_running_loop()
+    if _ASYNC_HTTP_CLIENT is None or _ASYNC_HTTP_LOOP is not loop:
+        if _ASYNC_HTTP_CLIENT is not None:
+            if _ASYNC_HTTP_LOOP.is_running():
+                asyncio.run_coroutine_threadsafe(
+                    _ASYNC_HTTP_CLIENT.aclose(), _ASYNC_HTTP_LOOP
+                )
+            else:
+                logger.warning(
+                    "Async HTTP client was not closed before its event loop "
+                    "ended; await ConversationAgent.aclose() when done"
+                )
+        _ASYNC_HTTP_CLIENT = httpx.AsyncClient(
+            http2=True, timeout=Config.HTTP_TIMEOUT, limits=_HTTP_LIMITS
+        )
+        _ASYNC_HTTP_LOOP = loop
+    return _ASYNC_HTTP_CLIENT
+
+
+async def _aclose_async_http_client():
+    """Close the shared async HTTP client."""
+    global _ASYNC_HTTP_CLIENT, _ASYNC_HTTP_LOOP
+    if _ASYNC_HTTP_CLIENT is not None:
+        await _ASYNC_HTTP_CLIENT.aclose()
+        _ASYNC_HTTP_CLIENT = None
+        _ASYNC_HTTP_LOOP = None
 
 
 class ConversationAgent:
@@ -28,39 +113,475 @@ class ConversationAgent:
         if not self.api_key:
             raise ValueError("NVIDIA_API_KEY not provided and not in config")
 
-        # Initialize OpenAI client for Nvidia API (OpenAI-compatible)
+        from openai import OpenAI
+
+        # Initialize OpenAI client for Nvidia API (OpenAI-compatible).
+        # The SDK retries 429/5xx responses with exponential backoff.
         self.client = OpenAI(
-            base_url=Config.NVIDIA_BASE_URL, api_key=self.api_key
+            base_url=Config.NVIDIA_BASE_URL,
+            api_key=self.api_key,
+            max_retries=Config.API_MAX_RETRIES,
+            timeout=Config.HTTP_TIMEOUT,
+            http_client=_get_http_client(),
+        )
+        self._aclient = None
+        self._aclient_http: Optional[httpx.AsyncClient] = None
+
+        # Raw HTTP path for completions, bypassing SDK serialization
+        self._http = _get_http_client()
+        self._completions_url = f"{Config.NVIDIA_BASE_URL}/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+        # Messages sent to the API: system prompt followed by history.
+        # Mutated in place so each call reuses the same list.
+        self._messages: List[Dict[str, str]] = [
+            {"role": "system", "content": self.system_prompt}
+        ]
+
+        # JSON encoding of the last messages sent, without brackets, reused
+        # while later requests extend it; reset when history is rewritten.
+        # The last message is kept encoded to check later requests extend it.
+        self._encoded = bytearray()
+        self._encoded_count = 0
+        self._encoded_last: Optional[bytes] = None
+        self._encoded_array: Optional[bytes] = None
+
+        # Message count above which _trim_context() trims history
+        self._trim_threshold = 1 + 2 * (
+            Config.MAX_CONTEXT_TURNS + Config.CONTEXT_TRIM_GRACE_TURNS
         )
 
-        # Conversation history
-        self.conversation_history: List[Dict[str, str]] = []
+        # Formatted history, rebuilt only after the history changes
+        self._history_str: Optional[str] = None
 
         logger.info(
             f"Initialized agent with model: {self.model} "
             f"(max context: {Config.MAX_CONTEXT_TURNS} turns)"
         )
 
-    def _build_messages(self) -> List[Dict[str, str]]:
-        """Build message list with system prompt and history.
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async OpenAI client on the shared HTTP pool of the running loop."""
+        http_client = _get_async_http_client()
+        if self._aclient is None or self._aclient_http is not http_client:
+            from openai import AsyncOpenAI
+
+            self._aclient = AsyncOpenAI(
+                base_url=Config.NVIDIA_BASE_URL,
+                api_key=self.api_key,
+                max_retries=Config.API_MAX_RETRIES,
+                timeout=Config.HTTP_TIMEOUT,
+                http_client=http_client,
+            )
+            self._aclient_http = http_client
+        return self._aclient
+
+    async def aclose(self):
+        """Close async HTTP connections opened by arespond()."""
+        await _aclose_async_http_client()
+        self._aclient = None
+        self._aclient_http = None
 
-        Returns:
-            List of messages for API call
+    @property
+    def conversation_history(self) -> Tuple[Dict[str, str], ...]:
+        """Conversation history without the system prompt.
+
+        Returns a read-only snapshot of copied messages; assign a new
+        history or use respond() and reset_conversation() to change it.
         """
-        messages = [{"role": "system", "content": self.system_prompt}]
-        messages.extend(self.conversation_history)
-        return messages
+        return tuple(dict(message) for message in self._messages[1:])
+
+    @conversation_history.setter
+    def conversation_history(self, history: List[Dict[str, str]]):
+        self._messages[1:] = [dict(message) for message in history]
+        self._history_str = None
+        self._encoded_count = 0
+
+    def _append(self, role: str, content: str):
+        """Append a message to history."""
+        self._messages.append({"role": role, "content": content})
+        self._history_str = None
 
     def _trim_context(self):
-        """Keep only the most recent turns to stay within context limit."""
-        if len(self.conversation_history) > Config.MAX_CONTEXT_TURNS * 2:
-            # Keep system context + last N turns (each turn = user + assistant)
-            self.conversation_history = self.conversation_history[
-                -(Config.MAX_CONTEXT_TURNS * 2) :
-            ]
-            logger.debug(
-                f"Trimmed context to last {Config.MAX_CONTEXT_TURNS} turns"
+        """Drop old turns from the middle of history once it overflows.
+
+        The Nvidia endpoint reuses KV cache for the longest prefix it has
+        already seen, so history is trimmed rarely and from the middle: the
+        system prompt and pinned opening turns never move, and between trims
+        each request extends the previous one unchanged.
+        """
+        if len(self._messages) <= self._trim_threshold:
+            return
+
+        # Drop whole user/assistant pairs after the pinned turns
+        start = 1 + Config.CONTEXT_PINNED_TURNS * 2
+        excess = len(self._messages) - 1 - Config.MAX_CONTEXT_TURNS * 2
+        del self._messages[start : start + excess + excess % 2]
+        self._history_str = None
+        self._encoded_count = 0
+        logger.debug(
+            f"Trimmed context to {Config.MAX_CONTEXT_TURNS} turns"
+        )
+
+    @staticmethod
+    def _cacheable() -> bool:
+        """Check whether responses may be cached at the current temperature.
+
+        Sampled responses (temperature > 0) are only cached on opt-in, in
+        both the exact-match and semantic caches.
+        """
+        return (
+            Config.RESPONSE_TEMPERATURE <= 0.0
+            or Config.CACHE_SAMPLED_RESPONSES
+        )
+
+    def _cache_key(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        """Build the response cache key for a message list.
+
+        Args:
+            messages: Full message list for the API call
+
+        Returns:
+            Cache key, or None if the response should not be cached
+        """
+        if not Config.ENABLE_RESPONSE_CACHE or not self._cacheable():
+            return None
+
+        # Keys only need collision resistance, so use the faster BLAKE2b
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(orjson.dumps([self.model, Config.RESPONSE_TEMPERATURE]))
+        digest.update(self._encode_messages(messages))
+        return digest.hexdigest()
+
+    def _semantic_text(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        """Get the text to match in the semantic cache, if it applies.
+
+        The semantic cache is only used for single-turn requests, so a
+        paraphrase match never answers a question asked in another context.
+
+        Args:
+            messages: Full message list for the API call
+
+        Returns:
+            User message, or None if the semantic cache does not apply
+        """
+        if (
+            _SEMANTIC_CACHE is None
+            or len(messages) != 2
+            or not self._cacheable()
+        ):
+            return None
+        return messages[-1]["content"]
+
+    def _semantic_scope(self) -> str:
+        """Get the semantic cache scope for this agent's configuration."""
+        return SemanticCache.scope_for(
+            self.model, self.system_prompt, Config.RESPONSE_TEMPERATURE
+        )
+
+    def _get_cached(
+        self, messages: List[Dict[str, str]]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Look up a cached response for messages.
+
+        Args:
+            messages: Full message list for the API call
+
+        Returns:
+            Tuple of (cache key, cached response or None)
+        """
+        key = self._cache_key(messages)
+        if key is not None and key in _RESPONSE_CACHE:
+            logger.debug("Response cache hit")
+            return key, _RESPONSE_CACHE[key]
+
+        text = self._semantic_text(messages)
+        if text is not None:
+            return key, _SEMANTIC_CACHE.lookup(text, self._semantic_scope())
+
+        return key, None
+
+    async def _aget_cached(
+        self, messages: List[Dict[str, str]]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Async variant of _get_cached().
+
+        Embedding runs in a worker thread to keep the event loop free.
+        """
+        key = self._cache_key(messages)
+        if key is not None and key in _RESPONSE_CACHE:
+            logger.debug("Response cache hit")
+            return key, _RESPONSE_CACHE[key]
+
+        text = self._semantic_text(messages)
+        if text is not None:
+            cached = await asyncio.to_thread(
+                _SEMANTIC_CACHE.lookup, text, self._semantic_scope()
+            )
+            return key, cached
+
+        return key, None
+
+    def _store_cached(
+        self,
+        key: Optional[str],
+        messages: List[Dict[str, str]],
+        assistant_message: str,
+    ):
+        """Store a fresh API response in the caches.
+
+        Args:
+            key: Cache key from _get_cached()
+            messages: Full message list for the API call
+            assistant_message: Response returned by the API
+        """
+        if key is not None:
+            _RESPONSE_CACHE[key] = assistant_message
+        text = self._semantic_text(messages)
+        if text is not None:
+            _SEMANTIC_CACHE.add(
+                text, self._semantic_scope(), assistant_message
+            )
+
+    async def _astore_cached(
+        self,
+        key: Optional[str],
+        messages: List[Dict[str, str]],
+        assistant_message: str,
+    ):
+        """Async variant of _store_cached()."""
+        if key is not None:
+            _RESPONSE_CACHE[key] = assistant_message
+        text = self._semantic_text(messages)
+        if text is not None:
+            await asyncio.to_thread(
+                _SEMANTIC_CACHE.add,
+                text,
+                self._semantic_scope(),
+                assistant_message,
+            )
+
+    def _encode_messages(self, messages: List[Dict[str, str]]) -> bytes:
+        """Serialize messages to a JSON array, reusing the last encoding.
+
+        Between trims each request's messages extend the previous ones, so
+        only the new messages are encoded and appended to the cached bytes.
+        The array itself is rebuilt once per change and then reused, so the
+        cache key and request body share one copy of the history.
+
+        Args:
+            messages: Full message list for the API call
+
+        Returns:
+            JSON array of messages
+        """
+        count = self._encoded_count
+        if (
+            count
+            and count <= len(messages)
+            and orjson.dumps(messages[count - 1]) == self._encoded_last
+        ):
+            if count == len(messages) and self._encoded_array is not None:
+                return self._encoded_array
+            if count < len(messages):
+                self._encoded += b"," + orjson.dumps(messages[count:])[1:-1]
+        else:
+            self._encoded = bytearray(orjson.dumps(messages)[1:-1])
+
+        self._encoded_count = len(messages)
+        self._encoded_last = orjson.dumps(messages[-1])
+        self._encoded_array = b"".join((b"[", self._encoded, b"]"))
+        return self._encoded_array
+
+    def _request_body(self, messages: List[Dict[str, str]]) -> bytes:
+        """Serialize a chat completion request with orjson.
+
+        Args:
+            messages: Full message list for the API call
+
+        Returns:
+            JSON request body
+        """
+        params = orjson.dumps(
+            {
+                "model": self.model,
+                "max_tokens": Config.MAX_RESPONSE_TOKENS,
+                "temperature": Config.RESPONSE_TEMPERATURE,
+            }
+        )
+        return b"".join(
+            (
+                params[:-1],
+                b',"messages":',
+                self._encode_messages(messages),
+                b"}",
+            )
+        )
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response) -> Optional[float]:
+        """Get how long to wait before retrying a raw request.
+
+        Args:
+            response: HTTP response from the completions endpoint
+
+        Returns:
+            Seconds to wait (from Retry-After, capped), or None if the
+            status is not one a retry can fix
+        """
+        if response.status_code != 429 and response.status_code < 500:
+            return None
+        try:
+            delay = float(response.headers.get("retry-after", ""))
+        except ValueError:
+            delay = 1.0
+        return min(max(delay, 0.0), Config.API_RETRY_AFTER_MAX)
+
+    @staticmethod
+    def _message_content(content: Optional[str]) -> str:
+        """Check that a completion carried message content."""
+        if content is None:
+            raise ValueError("Completion response has no message content")
+        return content
+
+    def _parse_completion(self, response: httpx.Response) -> str:
+        """Extract the assistant message from a raw API response.
+
+        Args:
+            response: HTTP response from the completions endpoint
+
+        Returns:
+            Assistant message content
+
+        Raises:
+            httpx.HTTPStatusError: If the request did not succeed
+            ValueError: If the response body is not a valid completion
+        """
+        response.raise_for_status()
+        try:
+            data = orjson.loads(response.content)
+            content = data["choices"][0]["message"]["content"]
+        except (orjson.JSONDecodeError, KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"Malformed completion response: {e}") from e
+
+        usage = data.get("usage") or {}
+        logger.debug(f"Used {usage.get('completion_tokens')} tokens")
+        return self._message_content(content)
+
+    def _complete(self, messages: List[Dict[str, str]]) -> str:
+        """Get a completion for messages, serving repeats from the cache.
+
+        Requests are posted directly with an orjson-encoded body. Requests
+        that fail in transport, or are rate limited or hit a server error,
+        are retried through the SDK (after any Retry-After delay), which
+        handles further backoff. Other error statuses raise.
+
+        Args:
+            messages: Full message list for the API call
+
+        Returns:
+            Assistant message content
+        """
+        key, cached = self._get_cached(messages)
+        if cached is not None:
+            return cached
+
+        # Call Nvidia API
+        logger.debug(f"Calling {self.model} with {len(messages)} messages")
+        use_sdk = not Config.USE_RAW_HTTP
+        if not use_sdk:
+            try:
+                response = self._http.post(
+                    self._completions_url,
+                    content=self._request_body(messages),
+                    headers=self._headers,
+                )
+            except httpx.TransportError as e:
+                logger.debug(f"Raw request failed ({e}); retrying with SDK")
+                use_sdk = True
+            else:
+                delay = self._retry_delay(response)
+                if delay is None:
+                    assistant_message = self._parse_completion(response)
+                else:
+                    logger.debug(
+                        f"Raw request returned HTTP {response.status_code}; "
+                        f"retrying with SDK in {delay:.1f}s"
+                    )
+                    time.sleep(delay)
+                    use_sdk = True
+
+        if use_sdk:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=Config.MAX_RESPONSE_TOKENS,
+                temperature=Config.RESPONSE_TEMPERATURE,
+            )
+            assistant_message = self._message_content(
+                response.choices[0].message.content
             )
+            logger.debug(f"Used {response.usage.completion_tokens} tokens")
+
+        self._store_cached(key, messages, assistant_message)
+        return assistant_message
+
+    async def _acomplete(self, messages: List[Dict[str, str]]) -> str:
+        """Async variant of _complete() using the async clients.
+
+        Args:
+            messages: Full message list for the API call
+
+        Returns:
+            Assistant message content
+        """
+        key, cached = await self._aget_cached(messages)
+        if cached is not None:
+            return cached
+
+        # Call Nvidia API
+        logger.debug(f"Calling {self.model} with {len(messages)} messages")
+        use_sdk = not Config.USE_RAW_HTTP
+        if not use_sdk:
+            try:
+                response = await _get_async_http_client().post(
+                    self._completions_url,
+                    content=self._request_body(messages),
+                    headers=self._headers,
+                )
+            except httpx.TransportError as e:
+                logger.debug(f"Raw request failed ({e}); retrying with SDK")
+                use_sdk = True
+            else:
+                delay = self._retry_delay(response)
+                if delay is None:
+                    assistant_message = self._parse_completion(response)
+                else:
+                    logger.debug(
+                        f"Raw request returned HTTP {response.status_code}; "
+                        f"retrying with SDK in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    use_sdk = True
+
+        if use_sdk:
+            response = await self.aclient.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=Config.MAX_RESPONSE_TOKENS,
+                temperature=Config.RESPONSE_TEMPERATURE,
+            )
+            assistant_message = self._message_content(
+                response.choices[0].message.content
+            )
+            logger.debug(f"Used {response.usage.completion_tokens} tokens")
+
+        await self._astore_cached(key, messages, assistant_message)
+        return assistant_message
 
     def respond(self, user_input: str) -> Optional[str]:
         """Generate a response to user input.
@@ -77,37 +598,117 @@ class ConversationAgent:
 
         try:
             # Add user message to history
-            self.conversation_history.append(
-                {"role": "user", "content": user_input}
-            )
+            self._append("user", user_input)
+
+            # Get response (from cache or Nvidia API)
+            assistant_message = self._complete(self._messages)
 
-            # Trim context if needed
+            # Add to history, trimming once the turn is complete
+            self._append("assistant", assistant_message)
             self._trim_context()
 
-            # Build messages
-            messages = self._build_messages()
+            logger.info(f"Agent response: '{assistant_message[:100]}...'")
+            return assistant_message
 
-            # Call Nvidia API
-            logger.debug(f"Calling {self.model} with {len(messages)} messages")
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=Config.MAX_RESPONSE_TOKENS,
-                temperature=Config.RESPONSE_TEMPERATURE,
-            )
+        except Exception as e:
+            logger.error(f"Failed to get response: {e}")
+            return None
 
-            # Extract response
-            assistant_message = response.choices[0].message.content
+    def respond_stream(self, user_input: str) -> Iterator[str]:
+        """Generate a response to user input, sentence by sentence.
 
-            # Add to history
-            self.conversation_history.append(
-                {"role": "assistant", "content": assistant_message}
-            )
+        Sentences are yielded as soon as they are complete in the streamed
+        completion, so speech synthesis can start before the full response
+        has been generated.
 
-            logger.info(
-                f"Agent response: '{assistant_message[:100]}...' "
-                f"({response.usage.completion_tokens} tokens)"
-            )
+        Args:
+            user_input: User's message/question
+
+        Yields:
+            Complete sentences of the agent's response
+        """
+        if not user_input or not user_input.strip():
+            logger.warning("Empty user input")
+            return
+
+        try:
+            # Add user message to history
+            self._append("user", user_input)
+
+            # Stream from Nvidia API unless the response is cached
+            key, cached = self._get_cached(self._messages)
+            if cached is not None:
+                deltas = iter([cached])
+            else:
+                logger.debug(
+                    f"Streaming {self.model} with {len(self._messages)} "
+                    "messages"
+                )
+                stream = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=self._messages,
+                    max_tokens=Config.MAX_RESPONSE_TOKENS,
+                    temperature=Config.RESPONSE_TEMPERATURE,
+                    stream=True,
+                )
+                deltas = (
+                    chunk.choices[0].delta.content or ""
+                    for chunk in stream
+                    if chunk.choices
+                )
+
+            # Split into sentences as text arrives
+            parts = []
+            pending = ""
+            for delta in deltas:
+                parts.append(delta)
+                pending += delta
+                while match := _SENTENCE_END.search(pending):
+                    yield pending[: match.end()].strip()
+                    pending = pending[match.end() :]
+            if pending.strip():
+                yield pending.strip()
+
+            assistant_message = "".join(parts)
+            if cached is None:
+                self._store_cached(key, self._messages, assistant_message)
+
+            # Add to history, trimming once the turn is complete
+            self._append("assistant", assistant_message)
+            self._trim_context()
+
+            logger.info(f"Agent response: '{assistant_message[:100]}...'")
+
+        except Exception as e:
+            logger.error(f"Failed to get response: {e}")
+
+    async def arespond(self, user_input: str) -> Optional[str]:
+        """Generate a single-turn response without blocking the event loop.
+
+        The request carries only the system prompt and user input, and
+        conversation history is left untouched, so concurrent calls (one
+        per batch file) are independent of each other and of call order.
+
+        Args:
+            user_input: User's message/question
+
+        Returns:
+            Agent's response or None if failed
+        """
+        if not user_input or not user_input.strip():
+            logger.warning("Empty user input")
+            return None
+
+        try:
+            messages = [
+                self._messages[0],
+                {"role": "user", "content": user_input},
+            ]
+
+            # Get response (from cache or Nvidia API)
+            assistant_message = await self._acomplete(messages)
+
+            logger.info(f"Agent response: '{assistant_message[:100]}...'")
             return assistant_message
 
         except Exception as e:
@@ -116,36 +717,37 @@ class ConversationAgent:
 
     def reset_conversation(self):
         """Clear conversation history."""
-        self.conversation_history = []
+        del self._messages[1:]
+        self._history_str = None
+        self._encoded_count = 0
         logger.info("Conversation history cleared")
 
     def get_conversation_history(
         self, format_string: bool = True
-    ) -> str | List[Dict[str, str]]:
+    ) -> str | Tuple[Dict[str, str], ...]:
         """Get conversation history.
 
         Args:
-            format_string: If True, return formatted string; else return list
+            format_string: If True, return formatted string; else return tuple
 
         Returns:
-            Conversation history as string or list
+            Conversation history as string or read-only tuple
         """
         if not format_string:
             return self.conversation_history
 
-        # Format as string
-        history = []
-        for msg in self.conversation_history:
-            role = msg["role"].upper()
-            content = msg["content"]
-            history.append(f"{role}: {content}")
-
-        return "\n\n".join(history)
+        # Format as string, reusing the last result until history changes
+        if self._history_str is None:
+            self._history_str = "\n\n".join(
+                f"{msg['role'].upper()}: {msg['content']}"
+                for msg in itertools.islice(self._messages, 1, None)
+            )
+        return self._history_str
 
     def get_turn_count(self) -> int:
         """Get number of conversation turns."""
         # Each turn = 1 user message + 1 assistant response = 2 messages
-        return len(self.conversation_history) // 2
+        return (len(self._messages) - 1) // 2
 
 
 class AgentFactory:
@@ -0,0 +1,44 @@
+"""Pool of reusable buffers for decoding audio files."""
+
+import os
+import queue
+from typing import Optional
+from .config import Config, logger
+
+
+class AudioBufferPool:
+    """Thread-safe pool of fixed-size bytearrays for int16 PCM audio.
+
+    Buffers are allocated on demand and kept for reuse, up to the pool
+    size, so back-to-back reads do not allocate a new array per file.
+    """
+
+    def __init__(
+        self, size: Optional[int] = None, buffer_bytes: Optional[int] = None
+    ):
+        """Initialize the buffer pool.
+
+        Args:
+            size: Maximum buffers retained (default: min(cpu_count, 8))
+            buffer_bytes: Size of each buffer (default: from config)
+        """
+        self.size = size or min(os.cpu_count() or 1, 8)
+        self.buffer_bytes = buffer_bytes or (
+            Config.AUDIO_SAMPLE_RATE * Config.AUDIO_BUFFER_SECONDS * 2
+        )
+        self._buffers: queue.Queue = queue.Queue(maxsize=self.size)
+
+    def acquire(self) -> bytearray:
+        """Take a buffer from the pool, allocating one if none is free."""
+        try:
+            return self._buffers.get_nowait()
+        except queue.Empty:
+            logger.debug("Allocating audio buffer")
+            return bytearray(self.buffer_bytes)
+
+    def release(self, buffer: bytearray):
+        """Return a buffer to the pool, dropping it if the pool is full."""
+        try:
+            self._buffers.put_nowait(buffer)
+        except queue.Full:
+            pass
@@ -25,10 +25,21 @@ class Config:
     MODEL_NAME: str = os.getenv(
         "MODEL_NAME", "qwen/qwen3-coder-480b-a35b-instruct"
     )
+    MAX_PARALLEL: int = int(os.getenv("NVIDIA_MAX_PARALLEL", "8"))
+    API_MAX_RETRIES: int = int(os.getenv("NVIDIA_MAX_RETRIES", "3"))
+    API_RETRY_AFTER_MAX: float = 10.0  # Longest Retry-After honoured (s)
+    HTTP_TIMEOUT: float = 60.0  # Seconds
+    HTTP_MAX_CONNECTIONS: int = 64
+    HTTP_MAX_KEEPALIVE: int = 32
+    # Post completions directly with orjson instead of through the SDK
+    USE_RAW_HTTP: bool = (
+        os.getenv("NVIDIA_RAW_HTTP", "true").lower() == "true"
+    )
 
     # Riva Configuration
     RIVA_URI: str = os.getenv("RIVA_URI", "localhost:50051")
     RIVA_HTTP_URI: str = os.getenv("RIVA_HTTP_URI", "http://localhost:9000")
+    RIVA_MAX_PARALLEL: int = int(os.getenv("RIVA_MAX_PARALLEL", "4"))
 
     # Audio Configuration
     AUDIO_SAMPLE_RATE: int = 16000  # Riva requires 16kHz
@@ -36,13 +47,47 @@ class Config:
     AUDIO_FRAME_LENGTH: int = 32000  # 2 seconds at 16kHz
     AUDIO_FORMAT: str = "PCM"  # Linear PCM
     AUDIO_DEVICE_INDEX: int = int(os.getenv("AUDIO_DEVICE_INDEX", "0"))
+    AUDIO_BUFFER_SECONDS: int = 30  # Pooled read buffer length
+    AUDIO_PLAYBACK: bool = (
+        os.getenv("AUDIO_PLAYBACK", "false").lower() == "true"
+    )
 
     # Conversation Configuration
     MAX_CONTEXT_TURNS: int = 10  # Keep last N turns
+    CONTEXT_TRIM_GRACE_TURNS: int = 4  # Extra turns allowed before trimming
+    CONTEXT_PINNED_TURNS: int = 1  # Opening turns never trimmed
     CONVERSATION_TIMEOUT: int = 30  # Seconds
     RESPONSE_TEMPERATURE: float = 0.7
     MAX_RESPONSE_TOKENS: int = 1024
 
+    # Response Cache Configuration
+    ENABLE_RESPONSE_CACHE: bool = (
+        os.getenv("ENABLE_RESPONSE_CACHE", "true").lower() == "true"
+    )
+    # Responses sampled with temperature > 0 are only cached on opt-in
+    CACHE_SAMPLED_RESPONSES: bool = (
+        os.getenv("CACHE_SAMPLED_RESPONSES", "false").lower() == "true"
+    )
+    RESPONSE_CACHE_SIZE: int = 1024
+    RESPONSE_CACHE_TTL: int = 3600  # Seconds
+
+    # Semantic Cache Configuration (requires sentence-transformers, faiss-cpu)
+    ENABLE_SEMANTIC_CACHE: bool = (
+        os.getenv("ENABLE_SEMANTIC_CACHE", "false").lower() == "true"
+    )
+    SEMANTIC_CACHE_MODEL: str = "all-MiniLM-L6-v2"
+    SEMANTIC_CACHE_THRESHOLD: float = float(
+        os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92")
+    )
+    SEMANTIC_CACHE_SIZE: int = 10000  # Entries per model/prompt
+    # Kept outside the project so cached conversations are never committed
+    SEMANTIC_CACHE_DIR: Path = Path(
+        os.getenv(
+            "SEMANTIC_CACHE_DIR",
+            str(Path.home() / ".cache" / "nvidia-voice-agent"),
+        )
+    )
+
     # Logging Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT: str = (
@@ -1,8 +1,12 @@
 """Main conversation loop orchestrating speech and AI components."""
 
+import asyncio
+import itertools
 import os
 import sys
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -12,9 +16,15 @@ except ImportError:
     pyaudio = None
 
 from .config import Config, logger
-from .speech_service import SpeechService
+from .speech_service import SpeechService, get_speech_service
 from .agent import ConversationAgent
 
+# Response files are numbered across all conversations in the process, and
+# tagged with a random per-process ID, so neither concurrent conversations
+# nor later runs overwrite earlier output
+_RUN_ID = uuid.uuid4().hex[:12]
+_OUTPUT_SEQ = itertools.count()
+
 
 class VoiceConversation:
     """Orchestrates voice conversation between user and AI agent."""
@@ -30,6 +40,8 @@ class VoiceConversation:
         self.speech_service: Optional[SpeechService] = None
         self.agent: Optional[ConversationAgent] = None
         self.conversation_count = 0
+        self._pyaudio = None
+        self._player = None
 
         # Initialize components
         self._initialize()
@@ -40,8 +52,8 @@ class VoiceConversation:
 
         # Initialize speech service
         try:
-            self.speech_service = SpeechService()
-            if not self.speech_service.connected:
+            self.speech_service = get_speech_service()
+            if self.speech_service is None:
                 logger.error("Failed to connect to Riva service")
                 raise RuntimeError("Riva connection failed")
             logger.info("✓ Riva speech service initialized")
@@ -57,8 +69,33 @@ class VoiceConversation:
             logger.error(f"Failed to initialize agent: {e}")
             raise
 
+        # Open speaker output for streamed responses
+        if Config.AUDIO_PLAYBACK and pyaudio is not None:
+            try:
+                self._pyaudio = pyaudio.PyAudio()
+                self._player = self._pyaudio.open(
+                    format=pyaudio.paInt16,
+                    channels=Config.AUDIO_CHANNELS,
+                    rate=Config.AUDIO_SAMPLE_RATE,
+                    output=True,
+                )
+                logger.info("✓ Audio playback enabled")
+            except Exception as e:
+                logger.warning(f"Audio playback unavailable: {e}")
+
         logger.info("✓ Voice conversation system ready")
 
+    def _output_name(self, prefix: str = "response") -> str:
+        """Get a unique file name for response audio.
+
+        Args:
+            prefix: File name prefix
+
+        Returns:
+            WAV file name
+        """
+        return f"{prefix}_{_RUN_ID}_{next(_OUTPUT_SEQ):06d}.wav"
+
     def process_audio_file(self, audio_file: str) -> bool:
         """Process audio from a file.
 
@@ -68,14 +105,15 @@ class VoiceConversation:
         Returns:
             True if successful, False otherwise
         """
-        if not Path(audio_file).exists():
+        audio_path = Path(audio_file)
+        if not audio_path.exists():
             logger.error(f"Audio file not found: {audio_file}")
             return False
 
         logger.info(f"Processing audio file: {audio_file}")
 
         # Transcribe
-        transcript = self.speech_service.transcribe(audio_file)
+        transcript = self.speech_service.transcribe(audio_path)
         if not transcript:
             logger.error("Failed to transcribe audio")
             return False
@@ -91,8 +129,8 @@ class VoiceConversation:
         print(f"Agent: {response}")
 
         # Synthesize response
-        output_file = (
-            Path(audio_file).parent / f"response_{time.time():.0f}.wav"
+        output_file = audio_path.parent / self._output_name(
+            f"{audio_path.stem}_resp"
         )
         audio_bytes = self.speech_service.synthesize(
             response, str(output_file)
@@ -106,31 +144,151 @@ class VoiceConversation:
         self.conversation_count += 1
         return True
 
-    def process_text_input(self, text: str) -> bool:
-        """Process text input (simulating speech).
+    async def aprocess_audio_file(
+        self,
+        audio_file: str,
+        asr_slots: asyncio.Semaphore,
+        llm_slots: asyncio.Semaphore,
+        tts_pool: ThreadPoolExecutor,
+    ) -> bool:
+        """Process audio from a file as a coroutine for batch mode.
+
+        Each stage is bounded separately, so while one file waits on the
+        LLM others can be transcribed or synthesized, and batch throughput
+        is set by the slowest stage rather than the sum of all three.
+        Each file is answered on its own, without conversation history,
+        so results do not depend on which files finish first.
 
         Args:
-            text: User input text
+            audio_file: Path to audio file
+            asr_slots: Bounds concurrent transcriptions
+            llm_slots: Bounds concurrent LLM requests
+            tts_pool: Worker threads for blocking TTS calls
 
         Returns:
             True if successful, False otherwise
         """
-        print(f"\nYou: {text}")
+        audio_path = Path(audio_file)
+        if not audio_path.exists():
+            logger.error(f"Audio file not found: {audio_file}")
+            return False
+
+        logger.info(f"Processing audio file: {audio_file}")
+
+        # Transcribe (streaming ASR on the async Riva channel)
+        async with asr_slots:
+            transcript = await self.speech_service.atranscribe(audio_path)
+        if not transcript:
+            logger.error(f"Failed to transcribe audio: {audio_file}")
+            return False
 
         # Get AI response
-        response = self.agent.respond(text)
+        async with llm_slots:
+            response = await self.agent.arespond(transcript)
         if not response:
-            logger.error("Failed to get AI response")
+            logger.error(f"Failed to get AI response: {audio_file}")
             return False
 
+        print(f"\nYou: {transcript}")
         print(f"Agent: {response}")
 
-        # Synthesize response
-        output_file = f"response_{time.time():.0f}.wav"
-        audio_bytes = self.speech_service.synthesize(response, output_file)
+        # Synthesize response (TTS call bounded by the TTS pool)
+        output_file = audio_path.parent / self._output_name(
+            f"{audio_path.stem}_resp"
+        )
+        audio_bytes = await self.speech_service.asynthesize(
+            response, str(output_file), tts_pool
+        )
 
         if audio_bytes:
             print(f"Response audio saved to: {output_file}")
+        else:
+            logger.warning("Failed to synthesize response audio")
+
+        self.conversation_count += 1
+        return True
+
+    async def _run_batch(self, audio_files: list) -> list:
+        """Process audio files concurrently as an ASR -> LLM -> TTS pipeline.
+
+        Args:
+            audio_files: List of audio file paths
+
+        Returns:
+            Per-file success flags, in input order
+        """
+        asr_slots = asyncio.BoundedSemaphore(Config.RIVA_MAX_PARALLEL)
+        llm_slots = asyncio.BoundedSemaphore(Config.MAX_PARALLEL)
+
+        # Worker threads for blocking Riva TTS calls, owned by this batch
+        tts_pool = ThreadPoolExecutor(
+            max_workers=Config.RIVA_MAX_PARALLEL, thread_name_prefix="tts"
+        )
+
+        try:
+            return await asyncio.gather(
+                *[
+                    self.aprocess_audio_file(
+                        audio_file, asr_slots, llm_slots, tts_pool
+                    )
+                    for audio_file in audio_files
+                ]
+            )
+        finally:
+            tts_pool.shutdown(wait=False)
+            await self.speech_service.aclose()
+            await self.agent.aclose()
+
+    def process_text_input(self, text: str) -> bool:
+        """Process text input (simulating speech).
+
+        The response is streamed: each sentence is synthesized (and played,
+        if playback is enabled) as soon as the agent produces it.
+
+        Args:
+            text: User input text
+
+        Returns:
+            True if successful, False otherwise
+        """
+        print(f"\nYou: {text}")
+
+        # Stream AI response, synthesizing sentence by sentence
+        sentences = []
+        audio_chunks = []
+        for sentence in self.agent.respond_stream(text):
+            if not sentences:
+                print("Agent:", end="")
+            sentences.append(sentence)
+            print(f" {sentence}", end="", flush=True)
+
+            audio_bytes = self.speech_service.synthesize(sentence)
+            if audio_bytes:
+                audio_chunks.append(audio_bytes)
+                if self._player:
+                    try:
+                        self._player.write(audio_bytes)
+                    except Exception as e:
+                        logger.warning(f"Audio playback failed: {e}")
+                        self._player = None
+
+        if not sentences:
+            logger.error("Failed to get AI response")
+            return False
+        print()
+
+        # Save full response audio
+        if audio_chunks:
+            output_file = self._output_name()
+            try:
+                self.speech_service.save_audio(
+                    b"".join(audio_chunks), output_file
+                )
+                print(f"Response audio saved to: {output_file}")
+            except Exception as e:
+                logger.warning(f"Failed to save response audio: {e}")
+        else:
+            logger.warning("Failed to synthesize response audio")
 
         self.conversation_count += 1
         return True
@@ -192,14 +350,9 @@ class VoiceConversation:
         print(f"NVIDIA Voice Agent - Batch Processing ({len(audio_files)} files)")
         print("=" * 60 + "\n")
 
-        successful = 0
-        failed = 0
-
-        for audio_file in audio_files:
-            if self.process_audio_file(audio_file):
-                successful += 1
-            else:
-                failed += 1
+        results = asyncio.run(self._run_batch(audio_files))
+        successful = sum(results)
+        failed = len(results) - successful
 
         print("\n" + "=" * 60)
         print(f"Results: {successful} successful, {failed} failed")
@@ -208,9 +361,15 @@ class VoiceConversation:
         self.close()
 
     def close(self):
-        """Clean up resources."""
-        if self.speech_service:
-            self.speech_service.close()
+        """Clean up resources.
+
+        The speech service is shared process-wide and closes itself at exit.
+        """
+        if self._player:
+            self._player.stop_stream()
+            self._player.close()
+        if self._pyaudio:
+            self._pyaudio.terminate()
         logger.info(
             f"Closed conversation (processed {self.conversation_count} turns)"
         )
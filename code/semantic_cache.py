@@ -0,0 +1,222 @@
+"""Semantic response cache using sentence embeddings and FAISS."""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict
+from .config import Config, logger
+
+
+class SemanticCache:
+    """Cache that serves stored responses for paraphrased questions.
+
+    User turns are embedded with a sentence-transformers model and matched
+    by cosine similarity against a FAISS inner-product index over
+    L2-normalized embeddings. Entries are partitioned by scope (see
+    scope_for()), so responses are only served to agents configured the
+    same way. The model and indexes are loaded on first use; if
+    sentence-transformers or faiss is not installed the cache disables
+    itself and every lookup misses.
+
+    New entries are kept in memory and written to disk at exit.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        threshold: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """Initialize the semantic cache.
+
+        Args:
+            cache_dir: Directory for index files (default: from config)
+            threshold: Minimum cosine similarity for a hit (default: from config)
+            max_entries: Maximum entries per scope (default: from config)
+        """
+        self.cache_dir = Path(cache_dir or Config.SEMANTIC_CACHE_DIR)
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else Config.SEMANTIC_CACHE_THRESHOLD
+        )
+        self.max_entries = max_entries or Config.SEMANTIC_CACHE_SIZE
+        self.available = True
+
+        # Guards the model, indexes and embedding memo across threads
+        self._lock = threading.Lock()
+        self._faiss = None
+        self._model = None
+        self._indexes: Dict[str, object] = {}
+        self._responses: Dict[str, List[str]] = {}
+        self._dirty: set = set()
+        self._last_text: Optional[str] = None
+        self._last_embedding = None
+
+    @staticmethod
+    def scope_for(model: str, system_prompt: str, temperature: float) -> str:
+        """Get the cache scope for an agent configuration.
+
+        Args:
+            model: Model name
+            system_prompt: System instruction
+            temperature: Sampling temperature
+
+        Returns:
+            Scope identifier, also used as the index file name
+        """
+        payload = json.dumps([model, system_prompt, temperature])
+        return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+    def _load(self) -> bool:
+        """Load the embedding model on first use."""
+        if self._model is not None:
+            return True
+        if not self.available:
+            return False
+
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.warning(
+                "Semantic cache disabled: "
+                "sentence-transformers and faiss-cpu are not installed"
+            )
+            self.available = False
+            return False
+
+        try:
+            model = SentenceTransformer(Config.SEMANTIC_CACHE_MODEL)
+        except Exception as e:
+            logger.error(f"Failed to load semantic cache model: {e}")
+            self.available = False
+            return False
+
+        self._faiss = faiss
+        self._model = model
+        atexit.register(self.save)
+        return True
+
+    def _paths(self, scope: str):
+        """Get the index and responses file paths for a scope."""
+        return (
+            self.cache_dir / f"{scope}.faiss",
+            self.cache_dir / f"{scope}.json",
+        )
+
+    def _get_scope(self, scope: str):
+        """Get the index and responses for a scope, loading them from disk."""
+        if scope in self._indexes:
+            return self._indexes[scope], self._responses[scope]
+
+        index = None
+        responses: List[str] = []
+        index_path, responses_path = self._paths(scope)
+        if index_path.exists() and responses_path.exists():
+            try:
+                index = self._faiss.read_index(str(index_path))
+                responses = json.loads(responses_path.read_text())
+                if index.ntotal != len(responses):
+                    logger.warning(
+                        f"Discarding inconsistent semantic cache {index_path}"
+                    )
+                    index, responses = None, []
+            except Exception as e:
+                logger.warning(f"Failed to read semantic cache: {e}")
+                index, responses = None, []
+
+        if index is None:
+            index = self._faiss.IndexFlatIP(
+                self._model.get_sentence_embedding_dimension()
+            )
+
+        logger.info(f"Loaded semantic cache with {index.ntotal} entries")
+        self._indexes[scope] = index
+        self._responses[scope] = responses
+        return index, responses
+
+    def _embed(self, text: str):
+        """Embed text, reusing the embedding of the last lookup."""
+        if text != self._last_text:
+            self._last_embedding = self._model.encode(
+                [text], normalize_embeddings=True
+            )
+            self._last_text = text
+        return self._last_embedding
+
+    def lookup(self, text: str, scope: str) -> Optional[str]:
+        """Find a stored response for a semantically equivalent question.
+
+        Args:
+            text: User message
+            scope: Scope from scope_for()
+
+        Returns:
+            Stored response or None if no entry is similar enough
+        """
+        with self._lock:
+            if not self._load():
+                return None
+            index, responses = self._get_scope(scope)
+            if index.ntotal == 0:
+                return None
+
+            scores, ids = index.search(self._embed(text), 1)
+            if scores[0, 0] < self.threshold:
+                return None
+
+            logger.debug(
+                f"Semantic cache hit (similarity: {scores[0, 0]:.3f})"
+            )
+            return responses[ids[0, 0]]
+
+    def add(self, text: str, scope: str, response: str):
+        """Store a response for later lookups.
+
+        Args:
+            text: User message
+            scope: Scope from scope_for()
+            response: Assistant response to serve for similar messages
+        """
+        with self._lock:
+            if not self._load():
+                return
+            index, responses = self._get_scope(scope)
+            if len(responses) >= self.max_entries:
+                logger.debug("Semantic cache full; not storing response")
+                return
+
+            index.add(self._embed(text))
+            responses.append(response)
+            self._dirty.add(scope)
+
+    def save(self):
+        """Write changed scopes to disk.
+
+        Each file is written to a temporary path and renamed into place;
+        a mismatched pair left by an interrupted save is discarded on load.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                for scope in self._dirty:
+                    index_path, responses_path = self._paths(scope)
+                    tmp_index = index_path.with_suffix(".faiss.tmp")
+                    tmp_responses = responses_path.with_suffix(".json.tmp")
+                    self._faiss.write_index(
+                        self._indexes[scope], str(tmp_index)
+                    )
+                    tmp_responses.write_text(
+                        json.dumps(self._responses[scope])
+                    )
+                    os.replace(tmp_index, index_path)
+                    os.replace(tmp_responses, responses_path)
+                self._dirty.clear()
+            except OSError as e:
+                logger.warning(f"Failed to persist semantic cache: {e}")
@@ -1,13 +1,33 @@
 """Speech-to-Text and Text-to-Speech service using NVIDIA Riva."""
 
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Executor
 import grpc
 import riva.client
-import numpy as np
-import soundfile as sf
+from riva.client.proto import (
+    riva_asr_pb2,
+    riva_asr_pb2_grpc,
+    riva_tts_pb2,
+    riva_tts_pb2_grpc,
+)
 from pathlib import Path
 from typing import Optional, Tuple
+from .audio_pool import AudioBufferPool
 from .config import Config, logger
 
+# Options for the async channel shared by concurrent streaming requests
+AIO_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.max_concurrent_streams", 32),
+]
+
+# Streaming ASR chunk size (4KB is ~125ms of 16kHz int16 audio)
+STREAM_CHUNK_BYTES = 4096
+
 
 class SpeechService:
     """Interface to NVIDIA Riva ASR and TTS services."""
@@ -20,6 +40,30 @@ class SpeechService:
         """
         self.riva_uri = riva_uri or Config.RIVA_URI
         self.connected = False
+        self.channel: Optional[grpc.Channel] = None
+        self._audio_pool = AudioBufferPool()
+        self._aio_channel: Optional[grpc.aio.Channel] = None
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Request fields that never change, built once and reused per call
+        self._asr_config = riva_asr_pb2.RecognitionConfig(
+            encoding=riva.client.AudioEncoding.LINEAR_PCM,
+            sample_rate_hertz=Config.AUDIO_SAMPLE_RATE,
+            language_code=Config.LANGUAGE_CODE,
+            max_alternatives=1,
+            enable_automatic_punctuation=True,
+            profanity_filter=False,
+        )
+        self._streaming_config = riva_asr_pb2.StreamingRecognitionConfig(
+            config=self._asr_config, interim_results=False
+        )
+        self._tts_template = riva_tts_pb2.SynthesizeSpeechRequest(
+            voice_name=Config.VOICE_NAME,
+            language_code=Config.LANGUAGE_CODE,
+            encoding=riva.client.AudioEncoding.LINEAR_PCM,
+            sample_rate_hz=Config.AUDIO_SAMPLE_RATE,
+        )
+
         self._connect()
 
     def _connect(self) -> bool:
@@ -29,8 +73,10 @@ class SpeechService:
                 self.riva_uri,
                 grpc.ssl_channel_credentials(),
             )
-            self.asr_service = riva.client.ASRServiceStub(self.channel)
-            self.tts_service = riva.client.SynthesizeServiceStub(
+            self.asr_service = riva_asr_pb2_grpc.RivaSpeechRecognitionStub(
+                self.channel
+            )
+            self.tts_service = riva_tts_pb2_grpc.RivaSpeechSynthesisStub(
                 self.channel
             )
             self.connected = True
@@ -41,11 +87,73 @@ class SpeechService:
             self.connected = False
             return False
 
-    def transcribe(self, audio_input: str | bytes) -> Optional[str]:
+    def _get_aio_asr_service(
+        self,
+    ) -> riva_asr_pb2_grpc.RivaSpeechRecognitionStub:
+        """Get the async ASR stub, opening its channel on first use.
+
+        grpc.aio channels are bound to an event loop, so the channel is
+        reopened if called from a different loop than the last one. The
+        old channel is closed on its own loop if that loop is still
+        running; callers should await aclose() before their loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aio_channel is None or self._aio_loop is not loop:
+            if self._aio_channel is not None:
+                if self._aio_loop.is_running():
+                    asyncio.run_coroutine_threadsafe(
+                        self._aio_channel.close(), self._aio_loop
+                    )
+                else:
+                    logger.warning(
+                        "Async Riva channel was not closed before its event "
+                        "loop ended; await SpeechService.aclose() when done"
+                    )
+            self._aio_channel = grpc.aio.secure_channel(
+                self.riva_uri,
+                grpc.ssl_channel_credentials(),
+                options=AIO_CHANNEL_OPTIONS,
+            )
+            self._aio_loop = loop
+            self.aio_asr_service = (
+                riva_asr_pb2_grpc.RivaSpeechRecognitionStub(self._aio_channel)
+            )
+        return self.aio_asr_service
+
+    def _read_audio(self, path: str | Path) -> bytes:
+        """Read an audio file as int16 PCM bytes.
+
+        Files that fit are decoded into a pooled buffer, leaving a single
+        copy into the returned bytes.
+
+        Args:
+            path: Path to audio file
+
+        Returns:
+            Raw int16 PCM audio
+        """
+        import numpy as np
+        import soundfile as sf
+
+        with sf.SoundFile(path) as audio_file:
+            samples = audio_file.frames * audio_file.channels
+            if samples * 2 > self._audio_pool.buffer_bytes:
+                return audio_file.read(dtype="int16").tobytes()
+
+            buffer = self._audio_pool.acquire()
+            try:
+                out = np.frombuffer(buffer, dtype=np.int16, count=samples)
+                if audio_file.channels > 1:
+                    out = out.reshape(audio_file.frames, audio_file.channels)
+                return audio_file.read(out=out).tobytes()
+            finally:
+                self._audio_pool.release(buffer)
+
+    def transcribe(self, audio_input: str | Path | bytes) -> Optional[str]:
         """Convert speech to text.
 
         Args:
-            audio_input: Path to audio file or audio bytes
+            audio_input: Path to an existing audio file, or audio bytes
 
         Returns:
             Transcribed text or None if failed
@@ -56,44 +164,111 @@ class SpeechService:
 
         try:
             # Load audio data
-            if isinstance(audio_input, str):
-                if not Path(audio_input).exists():
-                    logger.error(f"Audio file not found: {audio_input}")
-                    return None
-                audio_data, sr = sf.read(audio_input, dtype="int16")
-                audio_bytes = audio_data.tobytes()
+            if isinstance(audio_input, (str, Path)):
+                audio_bytes = self._read_audio(audio_input)
             else:
                 audio_bytes = audio_input
 
-            # Configure recognition
-            config = riva.client.RecognitionConfig(
-                encoding=riva.client.AudioEncoding.LINEAR_PCM,
-                sample_rate_hz=Config.AUDIO_SAMPLE_RATE,
-                language_code=Config.LANGUAGE_CODE,
-                max_alternatives=1,
-                enable_automatic_punctuation=True,
-                profanity_filter=False,
+            return self._call_asr(audio_bytes)
+
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            return None
+
+    def _call_asr(self, audio_bytes: bytes) -> Optional[str]:
+        """Transcribe audio with a unary Recognize call.
+
+        Args:
+            audio_bytes: Raw int16 PCM audio
+
+        Returns:
+            Transcribed text or None if nothing was recognized
+        """
+        # Create request
+        request = riva_asr_pb2.RecognizeRequest(
+            config=self._asr_config, audio=audio_bytes
+        )
+
+        # Call ASR service
+        response = self.asr_service.Recognize(request)
+
+        if response.results and response.results[0].alternatives:
+            transcript = response.results[0].alternatives[0].transcript
+            confidence = response.results[0].alternatives[0].confidence
+            logger.info(
+                f"Transcribed: '{transcript}' (confidence: {confidence:.2%})"
             )
+            return transcript
 
-            # Create request
-            request = riva.client.RecognizeRequest(
-                config=config, audio=audio_bytes
+        logger.warning("No transcription result returned")
+        return None
+
+    def _streaming_requests(self, audio_bytes: bytes):
+        """Yield the streaming config followed by fixed-size audio chunks."""
+        yield riva_asr_pb2.StreamingRecognizeRequest(
+            streaming_config=self._streaming_config
+        )
+        for start in range(0, len(audio_bytes), STREAM_CHUNK_BYTES):
+            yield riva_asr_pb2.StreamingRecognizeRequest(
+                audio_content=audio_bytes[start : start + STREAM_CHUNK_BYTES]
             )
 
-            # Call ASR service
-            response = self.asr_service.Recognize(request)
+    async def _acall_asr(self, audio_bytes: bytes) -> Optional[str]:
+        """Transcribe audio with streaming ASR on the async channel.
 
-            if response.results and response.results[0].alternatives:
-                transcript = response.results[0].alternatives[0].transcript
-                confidence = response.results[0].alternatives[0].confidence
-                logger.info(
-                    f"Transcribed: '{transcript}' (confidence: {confidence:.2%})"
-                )
-                return transcript
+        Args:
+            audio_bytes: Raw int16 PCM audio
+
+        Returns:
+            Transcribed text or None if nothing was recognized
+        """
+        call = self._get_aio_asr_service().StreamingRecognize(
+            self._streaming_requests(audio_bytes)
+        )
+        segments = []
+        async for response in call:
+            for result in response.results:
+                if result.is_final and result.alternatives:
+                    segments.append(result.alternatives[0].transcript.strip())
+
+        transcript = " ".join(segments).strip()
+        if transcript:
+            logger.info(f"Transcribed: '{transcript}'")
+            return transcript
+
+        logger.warning("No transcription result returned")
+        return None
+
+    async def atranscribe(
+        self, audio_input: str | Path | bytes
+    ) -> Optional[str]:
+        """Convert speech to text with streaming ASR on the async channel.
+
+        Concurrent calls share one HTTP/2 connection, each as its own stream.
+        Audio files are decoded in a worker thread so the event loop keeps
+        serving other requests meanwhile.
 
-            logger.warning("No transcription result returned")
+        Args:
+            audio_input: Path to an existing audio file, or audio bytes
+
+        Returns:
+            Transcribed text or None if failed
+        """
+        if not self.connected:
+            logger.error("Not connected to Riva service")
             return None
 
+        try:
+            # Load audio data
+            if isinstance(audio_input, (str, Path)):
+                audio_bytes = await asyncio.to_thread(
+                    self._read_audio, audio_input
+                )
+            else:
+                audio_bytes = audio_input
+
+            return await self._acall_asr(audio_bytes)
+
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             return None
@@ -119,26 +294,56 @@ class SpeechService:
             return None
 
         try:
-            # Create request
-            request = riva.client.SynthesizeSpeechRequest(
-                text=text,
-                voice_name=Config.VOICE_NAME,
-                language_code=Config.LANGUAGE_CODE,
-                encoding=riva.client.AudioEncoding.LINEAR_PCM,
-                sample_rate_hz=Config.AUDIO_SAMPLE_RATE,
-            )
+            audio_bytes = self._call_tts(text)
+
+            # Save to file if requested
+            if output_file:
+                self.save_audio(audio_bytes, output_file)
+
+            logger.info(f"Synthesized {len(text)} characters")
+            return audio_bytes
+
+        except Exception as e:
+            logger.error(f"Synthesis failed: {e}")
+            return None
+
+    async def asynthesize(
+        self,
+        text: str,
+        output_file: Optional[str] = None,
+        executor: Optional[Executor] = None,
+    ) -> Optional[bytes]:
+        """Convert text to speech without blocking the event loop.
+
+        The TTS call runs on the given executor and the file write in a
+        worker thread.
+
+        Args:
+            text: Text to synthesize
+            output_file: Path to save audio file (optional)
+            executor: Executor for the TTS call (default: loop's default)
+
+        Returns:
+            Audio bytes or None if failed
+        """
+        if not self.connected:
+            logger.error("Not connected to Riva service")
+            return None
 
-            # Call TTS service
-            response = self.tts_service.Synthesize(request)
+        if not text or not text.strip():
+            logger.error("Empty text provided for synthesis")
+            return None
 
-            # Convert to audio array
-            audio_bytes = bytes(response.audio)
+        try:
+            audio_bytes = await asyncio.get_running_loop().run_in_executor(
+                executor, self._call_tts, text
+            )
 
             # Save to file if requested
             if output_file:
-                audio_array = np.frombuffer(audio_bytes, dtype=np.int16)
-                sf.write(output_file, audio_array, Config.AUDIO_SAMPLE_RATE)
-                logger.info(f"Audio saved to {output_file}")
+                await asyncio.to_thread(
+                    self.save_audio, audio_bytes, output_file
+                )
 
             logger.info(f"Synthesized {len(text)} characters")
             return audio_bytes
@@ -147,6 +352,48 @@ class SpeechService:
             logger.error(f"Synthesis failed: {e}")
             return None
 
+    def _call_tts(self, text: str) -> bytes:
+        """Synthesize text with a Synthesize call.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            Raw int16 PCM audio
+        """
+        # Create request
+        request = riva_tts_pb2.SynthesizeSpeechRequest()
+        request.CopyFrom(self._tts_template)
+        request.text = text
+
+        # Call TTS service
+        response = self.tts_service.Synthesize(request)
+
+        # Protobuf bytes fields are already bytes; avoid another copy
+        audio_bytes = response.audio
+        if not isinstance(audio_bytes, (bytes, bytearray, memoryview)):
+            audio_bytes = bytes(audio_bytes)
+        return audio_bytes
+
+    def save_audio(self, audio_bytes: bytes, output_file: str):
+        """Write int16 PCM audio to a WAV file.
+
+        Args:
+            audio_bytes: Raw int16 PCM audio
+            output_file: Path to save audio file
+        """
+        import numpy as np
+        import soundfile as sf
+
+        # np.frombuffer is a zero-copy view over the audio bytes
+        sf.write(
+            output_file,
+            np.frombuffer(audio_bytes, dtype=np.int16),
+            Config.AUDIO_SAMPLE_RATE,
+            subtype="PCM_16",
+        )
+        logger.info(f"Audio saved to {output_file}")
+
     def health_check(self) -> bool:
         """Check if Riva service is healthy.
 
@@ -155,12 +402,8 @@ class SpeechService:
         """
         try:
             # Try to make a simple call
-            request = riva.client.RecognizeRequest(
-                config=riva.client.RecognitionConfig(
-                    encoding=riva.client.AudioEncoding.LINEAR_PCM,
-                    sample_rate_hz=Config.AUDIO_SAMPLE_RATE,
-                ),
-                audio=b"",
+            request = riva_asr_pb2.RecognizeRequest(
+                config=self._asr_config, audio=b""
             )
             self.asr_service.Recognize(request)
             return True
@@ -180,19 +423,44 @@ class SpeechService:
         """Close connection to Riva server."""
         if self.channel:
             self.channel.close()
+            self.connected = False
             logger.info("Closed connection to Riva")
 
+    async def aclose(self):
+        """Close the async channel used by atranscribe()."""
+        if self._aio_channel is not None:
+            await self._aio_channel.close()
+            self._aio_channel = None
+            self._aio_loop = None
+
+
+# Process-wide instance returned by get_speech_service()
+_INSTANCE: Optional[SpeechService] = None
+_LOCK = threading.Lock()
+
 
 def get_speech_service() -> Optional[SpeechService]:
-    """Factory function to get SpeechService instance.
+    """Get the shared SpeechService instance.
+
+    The service is created on first use and reused afterwards, so the gRPC
+    channel is only set up once per process. It is closed at exit, or
+    recreated here if it has been closed explicitly.
 
     Returns:
         SpeechService instance or None if connection fails
     """
-    service = SpeechService()
-    if not service.connected:
-        return None
-    return service
+    global _INSTANCE
+    if _INSTANCE is None or not _INSTANCE.connected:
+        with _LOCK:
+            if _INSTANCE is None or not _INSTANCE.connected:
+                service = SpeechService()
+                if not service.connected:
+                    return None
+                # Finalize on the channel, not a bound method of the
+                # service, so the finalizer does not keep the service alive
+                weakref.finalize(service, service.channel.close)
+                _INSTANCE = service
+    return _INSTANCE
 
 
 if __name__ == "__main__":
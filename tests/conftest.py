@@ -0,0 +1,19 @@
+"""Shared test setup for NVIDIA Voice Agent."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# The source package lives in code/, which would shadow the stdlib "code"
+# module if imported by that name, so load it as "voice_agent" instead
+CODE_DIR = Path(__file__).parent.parent / "code"
+
+if "voice_agent" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        "voice_agent",
+        CODE_DIR / "__init__.py",
+        submodule_search_locations=[str(CODE_DIR)],
+    )
+    _package = importlib.util.module_from_spec(_spec)
+    sys.modules["voice_agent"] = _package
+    _spec.loader.exec_module(_package)
@@ -1,15 +1,14 @@
 """Tests for conversational AI agent."""
 
+import asyncio
+import httpx
+import orjson
 import pytest
-import sys
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
-# Add code to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
-
-from agent import ConversationAgent, AgentFactory
-from config import Config
+from voice_agent import agent as agent_module
+from voice_agent.agent import ConversationAgent, AgentFactory
+from voice_agent.config import Config
 
 
 class TestConversationAgent:
@@ -17,52 +16,329 @@ class TestConversationAgent:
 
     @pytest.fixture
     def agent(self):
-        """Create agent instance."""
-        return ConversationAgent()
+        """Create agent instance that calls the API through the SDK."""
+        with patch.object(Config, "USE_RAW_HTTP", False), patch.object(
+            Config, "NVIDIA_API_KEY", "test-key"
+        ):
+            yield ConversationAgent()
 
     def test_agent_initialization(self, agent):
         """Test agent initializes correctly."""
         assert agent is not None
         assert agent.model == Config.MODEL_NAME
         assert agent.api_key == Config.NVIDIA_API_KEY
-        assert agent.conversation_history == []
+        assert agent.conversation_history == ()
 
     def test_agent_missing_api_key(self):
         """Test agent requires API key."""
-        with pytest.raises(ValueError):
+        with patch.object(Config, "NVIDIA_API_KEY", ""), pytest.raises(
+            ValueError
+        ):
             ConversationAgent(api_key="")
 
+    @staticmethod
+    def _turns(count):
+        """Build count user/assistant turn pairs."""
+        return [
+            message
+            for i in range(count)
+            for message in (
+                {"role": "user", "content": f"Message {i}"},
+                {"role": "assistant", "content": f"Response {i}"},
+            )
+        ]
+
     def test_conversation_history(self, agent):
         """Test conversation history management."""
         assert agent.get_turn_count() == 0
         assert len(agent.conversation_history) == 0
 
+        agent.conversation_history = self._turns(2)
+        assert agent.get_turn_count() == 2
+
+    def test_conversation_history_read_only(self, agent):
+        """Test history cannot be mutated through the property."""
+        for history in (
+            agent.conversation_history,
+            agent.get_conversation_history(format_string=False),
+        ):
+            with pytest.raises(AttributeError):
+                history.append({"role": "user", "content": "Hi"})
+
     def test_context_trimming(self, agent):
         """Test conversation context trimming."""
         # Add many turns to exceed limit
-        for i in range(20):
-            agent.conversation_history.append(
-                {"role": "user", "content": f"Message {i}"}
-            )
-            agent.conversation_history.append(
-                {"role": "assistant", "content": f"Response {i}"}
-            )
+        agent.conversation_history = self._turns(20)
 
         initial_count = len(agent.conversation_history)
         agent._trim_context()
 
         # Should trim to reasonable size
         assert len(agent.conversation_history) <= initial_count
+        assert (
+            len(agent.conversation_history) <= Config.MAX_CONTEXT_TURNS * 2
+        )
+
+    def test_context_trimming_preserves_prefix(self, agent):
+        """Test trimming keeps the opening turn and drops from the middle."""
+        limit = Config.MAX_CONTEXT_TURNS + Config.CONTEXT_TRIM_GRACE_TURNS
+        agent.conversation_history = self._turns(limit)
+
+        # Within the grace window nothing is trimmed
+        agent._trim_context()
+        assert len(agent.conversation_history) == limit * 2
+
+        agent.conversation_history = [
+            *agent.conversation_history,
+            {"role": "user", "content": "Latest"},
+        ]
+        agent._trim_context()
+
+        history = agent.conversation_history
+        assert history[0]["content"] == "Message 0"
+        assert history[1]["content"] == "Response 0"
+        assert history[2]["role"] == "user"
+        assert history[-1]["content"] == "Latest"
+        assert len(history) <= Config.MAX_CONTEXT_TURNS * 2
 
     def test_reset_conversation(self, agent):
         """Test clearing conversation history."""
-        agent.conversation_history.append(
-            {"role": "user", "content": "Test"}
-        )
+        agent.conversation_history = [{"role": "user", "content": "Test"}]
         agent.reset_conversation()
 
         assert len(agent.conversation_history) == 0
 
+    def test_arespond_is_single_turn(self, agent):
+        """Test async responses ignore and leave history untouched."""
+        agent.conversation_history = [
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello!"},
+        ]
+        agent._acomplete = AsyncMock(return_value="Paris.")
+
+        response = asyncio.run(agent.arespond("Capital of France?"))
+
+        assert response == "Paris."
+        agent._acomplete.assert_awaited_once_with([
+            {"role": "system", "content": agent.system_prompt},
+            {"role": "user", "content": "Capital of France?"},
+        ])
+        assert len(agent.conversation_history) == 2
+
+    def test_response_cache_skips_api_call(self, agent):
+        """Test identical requests are served from the response cache."""
+        completion = MagicMock()
+        completion.choices[0].message.content = "Hello!"
+        agent.client = MagicMock()
+        agent.client.chat.completions.create.return_value = completion
+        agent_module._RESPONSE_CACHE.clear()
+
+        with patch.object(Config, "RESPONSE_TEMPERATURE", 0.0):
+            assert agent.respond("Hi") == "Hello!"
+            agent.reset_conversation()
+            assert agent.respond("Hi") == "Hello!"
+
+        assert agent.client.chat.completions.create.call_count == 1
+
+    def test_response_cache_skips_sampled_responses(self, agent):
+        """Test responses with temperature > 0 are not cached by default."""
+        with patch.object(Config, "RESPONSE_TEMPERATURE", 0.7), patch.object(
+            Config, "CACHE_SAMPLED_RESPONSES", False
+        ):
+            assert agent._cache_key(
+                [{"role": "system", "content": agent.system_prompt}]
+            ) is None
+
+    def test_semantic_cache_single_turn_only(self, agent):
+        """Test the semantic cache is skipped once history exists."""
+        semantic_cache = MagicMock()
+        semantic_cache.lookup.return_value = "Paris."
+        agent.client = MagicMock()
+
+        with patch.object(
+            agent_module, "_SEMANTIC_CACHE", semantic_cache
+        ), patch.object(Config, "RESPONSE_TEMPERATURE", 0.0):
+            assert agent.respond("France's capital?") == "Paris."
+            agent.respond("And Germany's?")
+            scope = agent._semantic_scope()
+
+        semantic_cache.lookup.assert_called_once_with(
+            "France's capital?", scope
+        )
+        agent.client.chat.completions.create.assert_called_once()
+
+    def test_semantic_cache_skips_sampled_responses(self, agent):
+        """Test the semantic cache follows the sampled-response policy."""
+        semantic_cache = MagicMock()
+        completion = MagicMock()
+        completion.choices[0].message.content = "Paris."
+        agent.client = MagicMock()
+        agent.client.chat.completions.create.return_value = completion
+
+        with patch.object(
+            agent_module, "_SEMANTIC_CACHE", semantic_cache
+        ), patch.object(Config, "RESPONSE_TEMPERATURE", 0.7), patch.object(
+            Config, "CACHE_SAMPLED_RESPONSES", False
+        ):
+            assert agent.respond("France's capital?") == "Paris."
+
+        semantic_cache.lookup.assert_not_called()
+        semantic_cache.add.assert_not_called()
+
+    def test_semantic_cache_scoped_by_configuration(self, agent):
+        """Test agents with another model or prompt use another scope."""
+        scope = agent._semantic_scope()
+
+        assert ConversationAgent(model="other/model")._semantic_scope() != scope
+        assert (
+            ConversationAgent(system_prompt="Be terse.")._semantic_scope()
+            != scope
+        )
+        with patch.object(Config, "RESPONSE_TEMPERATURE", 0.0):
+            assert agent._semantic_scope() != scope
+
+    def test_respond_stream_yields_sentences(self, agent):
+        """Test streamed responses are split into complete sentences."""
+        chunks = []
+        for text in ["Hello there", "! How are", " you? I am ", "fine."]:
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = text
+            chunks.append(chunk)
+        agent.client = MagicMock()
+        agent.client.chat.completions.create.return_value = iter(chunks)
+
+        sentences = list(agent.respond_stream("Hi"))
+
+        assert sentences == ["Hello there!", "How are you?", "I am fine."]
+        assert agent.conversation_history[-1] == {
+            "role": "assistant",
+            "content": "Hello there! How are you? I am fine.",
+        }
+
+    def test_formatted_history_updates(self, agent):
+        """Test formatted history reflects new turns and resets."""
+        completion = MagicMock()
+        completion.choices[0].message.content = "Hello!"
+        agent.client = MagicMock()
+        agent.client.chat.completions.create.return_value = completion
+
+        assert agent.get_conversation_history() == ""
+        agent.respond("Hi")
+        assert agent.get_conversation_history() == "USER: Hi\n\nASSISTANT: Hello!"
+        agent.reset_conversation()
+        assert agent.get_conversation_history() == ""
+
+    def test_raw_http_completion(self, agent):
+        """Test completions posted directly with an orjson body."""
+        response = MagicMock()
+        response.status_code = 200
+        response.content = (
+            b'{"choices": [{"message": {"content": "Hello!"}}], '
+            b'"usage": {"completion_tokens": 2}}'
+        )
+        agent._http = MagicMock()
+        agent._http.post.return_value = response
+        agent.client = MagicMock()
+
+        with patch.object(Config, "USE_RAW_HTTP", True):
+            assert agent.respond("Hi") == "Hello!"
+
+        body = agent._http.post.call_args.kwargs["content"]
+        assert b'"content":"Hi"' in body
+        agent.client.chat.completions.create.assert_not_called()
+
+    def test_raw_http_client_error_not_retried(self, agent):
+        """Test client errors fail without re-sending through the SDK."""
+        request = httpx.Request("POST", agent._completions_url)
+        agent._http = MagicMock()
+        agent._http.post.return_value = httpx.Response(401, request=request)
+        agent.client = MagicMock()
+
+        with patch.object(Config, "USE_RAW_HTTP", True):
+            assert agent.respond("Hi") is None
+
+        agent.client.chat.completions.create.assert_not_called()
+
+    def test_raw_http_rate_limit_waits_then_uses_sdk(self, agent):
+        """Test rate-limited requests honour Retry-After before the SDK."""
+        request = httpx.Request("POST", agent._completions_url)
+        agent._http = MagicMock()
+        agent._http.post.return_value = httpx.Response(
+            429, headers={"Retry-After": "2"}, request=request
+        )
+        completion = MagicMock()
+        completion.choices[0].message.content = "Hello!"
+        agent.client = MagicMock()
+        agent.client.chat.completions.create.return_value = completion
+
+        with patch.object(Config, "USE_RAW_HTTP", True), patch.object(
+            agent_module.time, "sleep"
+        ) as sleep:
+            assert agent.respond("Hi") == "Hello!"
+
+        sleep.assert_called_once_with(2.0)
+        agent.client.chat.completions.create.assert_called_once()
+
+    def test_raw_http_malformed_response(self, agent):
+        """Test null content and malformed bodies fail without fallback."""
+        request = httpx.Request("POST", agent._completions_url)
+        agent._http = MagicMock()
+        agent.client = MagicMock()
+
+        for content in (
+            b'{"choices": [{"message": {"content": null}}]}',
+            b"not json",
+        ):
+            agent._http.post.return_value = httpx.Response(
+                200, content=content, request=request
+            )
+            with patch.object(Config, "USE_RAW_HTTP", True):
+                assert agent.respond("Hi") is None
+
+        agent.client.chat.completions.create.assert_not_called()
+
+    def test_async_http_client_per_loop(self, agent):
+        """Test a new loop gets a new client; an abandoned one is reported."""
+
+        async def get_client():
+            return agent_module._get_async_http_client()
+
+        with patch.object(agent_module.logger, "warning") as warning:
+            first = asyncio.run(get_client())
+            second = asyncio.run(get_client())
+
+        assert second is not first
+        warning.assert_called_once()
+        asyncio.run(agent.aclose())
+
+    def test_encode_messages_incremental(self, agent):
+        """Test incremental message encoding matches a full encoding."""
+        system = {"role": "system", "content": agent.system_prompt}
+        messages = [system]
+        for i in range(3):
+            messages.append({"role": "user", "content": f"Message {i}"})
+            assert agent._encode_messages(messages) == orjson.dumps(messages)
+            messages.append({"role": "assistant", "content": f"Response {i}"})
+
+        # A history that does not extend the last one is encoded afresh
+        messages = [system, {"role": "user", "content": "Again"}]
+        assert agent._encode_messages(messages) == orjson.dumps(messages)
+
+        # An in-place edit to the last message is not served stale
+        messages[-1]["content"] = "Edited"
+        assert agent._encode_messages(messages) == orjson.dumps(messages)
+
+    def test_history_edits_do_not_leak(self, agent):
+        """Test edits to returned history dicts leave the agent unchanged."""
+        agent.conversation_history = [{"role": "user", "content": "Hi"}]
+
+        agent.conversation_history[0]["content"] = "Edited"
+        agent.get_conversation_history(format_string=False)[0]["content"] = (
+            "Edited"
+        )
+
+        assert agent.conversation_history[0]["content"] == "Hi"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
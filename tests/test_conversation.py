@@ -0,0 +1,45 @@
+"""Tests for voice conversation orchestration."""
+
+import pytest
+from unittest.mock import patch
+
+from voice_agent.conversation import VoiceConversation
+
+
+class TestVoiceConversation:
+    """Test voice conversation helpers (no Riva server or API needed)."""
+
+    @pytest.fixture
+    def conversation(self):
+        """Create conversation without initializing speech or agent."""
+        with patch.object(VoiceConversation, "_initialize"):
+            conversation = VoiceConversation()
+        yield conversation
+        conversation.close()
+
+    def test_output_names_unique(self, conversation):
+        """Test response file names never repeat within a session."""
+        names = [conversation._output_name() for _ in range(100)]
+
+        assert len(set(names)) == len(names)
+        assert all(name.endswith(".wav") for name in names)
+
+    def test_output_name_includes_stem(self, conversation):
+        """Test batch response files are named after their input."""
+        name = conversation._output_name("greeting_resp")
+
+        assert name.startswith("greeting_resp_")
+        assert name != conversation._output_name("greeting_resp")
+
+
+    def test_output_names_unique_across_conversations(self, conversation):
+        """Test conversations created together never share a file name."""
+        with patch.object(VoiceConversation, "_initialize"):
+            other = VoiceConversation()
+
+        assert conversation._output_name() != other._output_name()
+        other.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
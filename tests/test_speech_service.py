@@ -1,14 +1,36 @@
 """Tests for speech service (STT/TTS)."""
 
+import asyncio
+import numpy as np
 import pytest
-import sys
-from pathlib import Path
+import socket
+import soundfile as sf
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Add code to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
+from riva.client.proto.riva_asr_pb2_grpc import RivaSpeechRecognitionStub
 
-from speech_service import SpeechService
-from config import Config
+from voice_agent.speech_service import SpeechService, STREAM_CHUNK_BYTES
+from voice_agent.audio_pool import AudioBufferPool
+from voice_agent.config import Config
+
+
+def _riva_reachable() -> bool:
+    """Check whether a Riva server is listening at the configured URI."""
+    host, _, port = Config.RIVA_URI.rpartition(":")
+    try:
+        with socket.create_connection((host, int(port)), timeout=1):
+            return True
+    except (OSError, ValueError):
+        return False
+
+
+# Tests that call the Riva server are skipped when none is running
+requires_riva = pytest.mark.skipif(
+    not _riva_reachable(), reason="Riva server not reachable"
+)
 
 
 class TestSpeechService:
@@ -27,10 +49,12 @@ class TestSpeechService:
         assert speech_service is not None
         assert speech_service.connected
 
+    @requires_riva
     def test_health_check(self, speech_service):
         """Test Riva service health check."""
         assert speech_service.health_check()
 
+    @requires_riva
     def test_synthesize_basic(self, speech_service):
         """Test basic text-to-speech."""
         text = "Hello, this is a test."
@@ -52,5 +76,193 @@ class TestSpeechService:
         assert Config.LANGUAGE_CODE == "en-US"
 
 
+class TestReadAudio:
+    """Test pooled audio file decoding (no Riva server needed)."""
+
+    @pytest.fixture
+    def speech_service(self):
+        """Create speech service instance; the channel connects lazily."""
+        service = SpeechService()
+        yield service
+        service.close()
+
+    @staticmethod
+    def _write_wav(path, channels, frames=1600):
+        """Write a WAV file of random int16 samples."""
+        rng = np.random.default_rng(0)
+        shape = (frames, channels) if channels > 1 else (frames,)
+        samples = rng.integers(-32768, 32767, size=shape, dtype=np.int16)
+        sf.write(path, samples, Config.AUDIO_SAMPLE_RATE, subtype="PCM_16")
+        return str(path)
+
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_read_audio_matches_soundfile(
+        self, speech_service, tmp_path, channels
+    ):
+        """Test pooled reads match a plain soundfile decode."""
+        path = self._write_wav(tmp_path / "audio.wav", channels)
+
+        audio = speech_service._read_audio(path)
+
+        assert audio == sf.read(path, dtype="int16")[0].tobytes()
+        assert speech_service._audio_pool._buffers.qsize() == 1
+
+    def test_read_audio_larger_than_buffer(self, speech_service, tmp_path):
+        """Test files larger than a pooled buffer are read directly."""
+        path = self._write_wav(tmp_path / "audio.wav", 1)
+        speech_service._audio_pool = AudioBufferPool(size=1, buffer_bytes=64)
+
+        audio = speech_service._read_audio(path)
+
+        assert audio == sf.read(path, dtype="int16")[0].tobytes()
+        assert speech_service._audio_pool._buffers.qsize() == 0
+
+    def test_read_audio_reuses_buffer(self, speech_service, tmp_path):
+        """Test back-to-back reads share one pooled buffer."""
+        first = self._write_wav(tmp_path / "first.wav", 1, frames=1600)
+        second = self._write_wav(tmp_path / "second.wav", 1, frames=800)
+
+        speech_service._read_audio(first)
+        buffer = speech_service._audio_pool._buffers.queue[0]
+        audio = speech_service._read_audio(second)
+
+        assert audio == sf.read(second, dtype="int16")[0].tobytes()
+        assert speech_service._audio_pool._buffers.qsize() == 1
+        assert speech_service._audio_pool._buffers.queue[0] is buffer
+
+
+class _StubASRService:
+    """ASR stub recording streamed requests and replaying responses."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = None
+
+    def StreamingRecognize(self, requests):
+        self.requests = list(requests)
+
+        async def call():
+            for response in self.responses:
+                yield response
+
+        return call()
+
+
+def _asr_response(transcript, is_final=True):
+    """Build a streaming ASR response with one result."""
+    alternative = SimpleNamespace(transcript=transcript)
+    result = SimpleNamespace(is_final=is_final, alternatives=[alternative])
+    return SimpleNamespace(results=[result])
+
+
+class TestAsyncSpeechService:
+    """Test async Riva paths against stubs (no Riva server needed)."""
+
+    @pytest.fixture
+    def speech_service(self):
+        """Create speech service instance; the channel connects lazily."""
+        service = SpeechService()
+        yield service
+        service.close()
+
+    def test_atranscribe_streams_config_then_chunks(self, speech_service):
+        """Test the config request is sent first, then 4KB audio chunks."""
+        stub = _StubASRService([_asr_response("Hello")])
+        audio = bytes(2 * STREAM_CHUNK_BYTES + 1000)
+
+        with patch.object(
+            speech_service, "_get_aio_asr_service", return_value=stub
+        ):
+            assert asyncio.run(speech_service.atranscribe(audio)) == "Hello"
+
+        first, *chunks = stub.requests
+        assert first.streaming_config == speech_service._streaming_config
+        assert [len(c.audio_content) for c in chunks] == [4096, 4096, 1000]
+        assert b"".join(c.audio_content for c in chunks) == audio
+
+    def test_aio_asr_service_per_loop(self, speech_service):
+        """Test the async stub is real and reopened for a new event loop."""
+
+        async def open_stub():
+            stub = speech_service._get_aio_asr_service()
+            assert speech_service._get_aio_asr_service() is stub
+            return stub
+
+        async def reopen_stub():
+            stub = await open_stub()
+            await speech_service.aclose()
+            return stub
+
+        first = asyncio.run(open_stub())
+        second = asyncio.run(reopen_stub())
+
+        assert isinstance(first, RivaSpeechRecognitionStub)
+        assert second is not first
+
+    def test_atranscribe_joins_final_results(self, speech_service):
+        """Test final transcripts are stripped and joined; interim dropped."""
+        stub = _StubASRService([
+            _asr_response(" Hello", is_final=False),
+            _asr_response(" Hello there. "),
+            _asr_response("How are you? "),
+        ])
+
+        with patch.object(
+            speech_service, "_get_aio_asr_service", return_value=stub
+        ):
+            transcript = asyncio.run(speech_service.atranscribe(bytes(100)))
+
+        assert transcript == "Hello there. How are you?"
+
+    def test_atranscribe_reads_file_off_event_loop(
+        self, speech_service, tmp_path
+    ):
+        """Test audio files are decoded in a worker thread and streamed."""
+        path = TestReadAudio._write_wav(tmp_path / "audio.wav", 1)
+        stub = _StubASRService([_asr_response("Hello")])
+        read_audio = speech_service._read_audio
+        threads = []
+
+        def tracked_read_audio(audio_path):
+            threads.append(threading.current_thread())
+            return read_audio(audio_path)
+
+        with patch.object(
+            speech_service, "_get_aio_asr_service", return_value=stub
+        ), patch.object(speech_service, "_read_audio", tracked_read_audio):
+            assert asyncio.run(speech_service.atranscribe(path)) == "Hello"
+
+        assert threads and threads[0] is not threading.main_thread()
+        streamed = b"".join(r.audio_content for r in stub.requests[1:])
+        assert streamed == sf.read(path, dtype="int16")[0].tobytes()
+
+    def test_asynthesize_uses_executor(self, speech_service, tmp_path):
+        """Test TTS runs on the given executor and saving off the loop."""
+        audio_bytes = np.arange(-800, 800, dtype=np.int16).tobytes()
+        save_audio = speech_service.save_audio
+        threads = {}
+
+        def call_tts(text):
+            threads["tts"] = threading.current_thread().name
+            return audio_bytes
+
+        def tracked_save_audio(audio, output_file):
+            threads["save"] = threading.current_thread()
+            save_audio(audio, output_file)
+
+        output_file = str(tmp_path / "out.wav")
+        with ThreadPoolExecutor(thread_name_prefix="tts-test") as pool, \
+                patch.object(speech_service, "_call_tts", call_tts), \
+                patch.object(speech_service, "save_audio", tracked_save_audio):
+            audio = asyncio.run(
+                speech_service.asynthesize("Hello.", output_file, pool)
+            )
+
+        assert audio == audio_bytes
+        assert threads["tts"].startswith("tts-test")
+        assert threads["save"] is not threading.main_thread()
+        assert sf.read(output_file, dtype="int16")[0].tobytes() == audio_bytes
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])